@@ -9,7 +9,8 @@ import sys
 import threading
 import time
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional
 from pathlib import Path
 
 # Configure logging
@@ -47,6 +48,10 @@ class HealthStatus:
     consecutive_anomalies: int = 0
     anomaly_score: float = 0
     error_message: Optional[str] = None
+    
+    def as_mapping(self) -> Mapping[str, Any]:
+        """Read-only view of the status fields, without copying them."""
+        return MappingProxyType(self.__dict__)
 
 @dataclass
 class AgentConfig:
@@ -2,13 +2,14 @@
 # redis_agent/failover.py - Failover module for Redis Enterprise
 
 import logging
+import sys
 import threading
 import time
 import json
 import boto3
 import requests
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger("redis-agent.failover")
@@ -43,6 +44,12 @@ class DNSFailoverProvider(FailoverProvider):
         """
         self.config = config
         self.dns_provider = self._create_dns_provider()
+        self._fallback_cache = {}  # (instance_uid, dc_name) -> fallback hostname
+        self._flat_endpoints = {
+            (uid, sys.intern(dc)): host
+            for uid, dc_hosts in config.dns_config.get("endpoint_map", {}).items()
+            for dc, host in dc_hosts.items()
+        }
     
     def _create_dns_provider(self):
         """Create the DNS provider based on configuration."""
@@ -62,14 +69,14 @@ class DNSFailoverProvider(FailoverProvider):
         dns_records = self._get_dns_records_for_instance(instance_uid, instance_info)
         
         if not dns_records:
-            logger.error(f"No DNS records configured for instance {instance_uid}")
+            logger.error("No DNS records configured for instance %s", instance_uid)
             return False
         
         # Get the target endpoint for the destination DC
         target_endpoint = self._get_endpoint_for_dc(instance_uid, to_dc, instance_info)
         
         if not target_endpoint:
-            logger.error(f"No endpoint found for instance {instance_uid} in datacenter {to_dc}")
+            logger.error("No endpoint found for instance %s in datacenter %s", instance_uid, to_dc)
             return False
         
         # Update DNS records
@@ -80,7 +87,7 @@ class DNSFailoverProvider(FailoverProvider):
             ttl = record.get("ttl", 60)
             
             if not record_name:
-                logger.error(f"Record name missing for instance {instance_uid}")
+                logger.error("Record name missing for instance %s", instance_uid)
                 success = False
                 continue
             
@@ -94,13 +101,13 @@ class DNSFailoverProvider(FailoverProvider):
                 )
                 
                 if result:
-                    logger.info(f"Successfully updated DNS record {record_name} to {target_endpoint}")
+                    logger.info("Successfully updated DNS record %s to %s", record_name, target_endpoint)
                 else:
-                    logger.error(f"Failed to update DNS record {record_name}")
+                    logger.error("Failed to update DNS record %s", record_name)
                     success = False
             
             except Exception as e:
-                logger.error(f"Error updating DNS record {record_name}: {e}")
+                logger.error("Error updating DNS record %s: %s", record_name, e)
                 success = False
         
         return success
@@ -146,18 +153,27 @@ class DNSFailoverProvider(FailoverProvider):
                 return endpoint["host"]
         
         # If not found in instance info, check if we have a mapping in DNS config
-        endpoint_map = self.config.dns_config.get("endpoint_map", {})
-        
-        if instance_uid in endpoint_map and dc_name in endpoint_map[instance_uid]:
-            return endpoint_map[instance_uid][dc_name]
-        
-        # If still not found, use a default format
-        instance_name = instance_info.get("name", instance_uid)
-        return f"{instance_name}.{dc_name}.example.com"  # Default fallback format
+        mapped = self._flat_endpoints.get((instance_uid, dc_name))
+        if mapped:
+            return mapped
+        
+        # If still not found, use a default format (cached per instance/DC)
+        key = (instance_uid, dc_name)
+        fallback = self._fallback_cache.get(key)
+        if fallback is None:
+            instance_name = instance_info.get("name", instance_uid)
+            fallback = self._fallback_cache.setdefault(
+                (instance_uid, sys.intern(dc_name)), f"{instance_name}.{dc_name}.example.com"
+            )
+        return fallback
 
 class Route53Provider:
     """AWS Route 53 DNS provider implementation"""
     
+    # Route 53 allows 5 API requests per second per account; stay just below it
+    RATE_LIMIT_PER_SECOND = 4.0
+    RATE_LIMIT_BURST = 5.0
+    
     def __init__(self, config):
         """Initialize the Route 53 provider.
         
@@ -166,6 +182,27 @@ class Route53Provider:
         """
         self.config = config
         self.route53 = self._create_route53_client()
+        
+        # Token bucket shared by all threads issuing change requests
+        self._bucket_tokens = self.RATE_LIMIT_BURST
+        self._bucket_last = time.monotonic()
+        self._bucket_lock = threading.Lock()
+    
+    def _acquire_token(self):
+        """Block until a Route 53 request token is available."""
+        with self._bucket_lock:
+            now = time.monotonic()
+            self._bucket_tokens = min(
+                self.RATE_LIMIT_BURST,
+                self._bucket_tokens + (now - self._bucket_last) * self.RATE_LIMIT_PER_SECOND
+            )
+            self._bucket_last = now
+            # Reserve a token; a negative balance is the wait owed by this caller
+            self._bucket_tokens -= 1
+            wait = -self._bucket_tokens / self.RATE_LIMIT_PER_SECOND
+        
+        if wait > 0:
+            time.sleep(wait)
     
     def _create_route53_client(self):
         """Create Route 53 client."""
@@ -199,6 +236,7 @@ class Route53Provider:
                 value = f"{value}."
             
             # Create the change batch
+            self._acquire_token()
             response = self.route53.change_resource_record_sets(
                 HostedZoneId=zone_id,
                 ChangeBatch={
@@ -220,11 +258,11 @@ class Route53Provider:
                 }
             )
             
-            logger.info(f"DNS update initiated: {response['ChangeInfo']['Id']}")
+            logger.info("DNS update initiated: %s", response['ChangeInfo']['Id'])
             return True
             
         except Exception as e:
-            logger.error(f"Error updating Route 53 record: {e}")
+            logger.error("Error updating Route 53 record: %s", e)
             return False
 
 class CloudDNSProvider:
@@ -252,18 +290,21 @@ class CloudDNSProvider:
                 return False
             
             # Log the operation
-            logger.info(f"Would update Cloud DNS record: {record_name} to {value} in zone {zone_name}")
+            logger.info("Would update Cloud DNS record: %s to %s in zone %s", record_name, value, zone_name)
             
             # Simulate success
             return True
             
         except Exception as e:
-            logger.error(f"Error updating Cloud DNS record: {e}")
+            logger.error("Error updating Cloud DNS record: %s", e)
             return False
 
 class FailoverDecision:
     """Represents a failover decision with reasoning and confidence."""
     
+    __slots__ = ("instance_uid", "instance_name", "from_dc", "to_dc",
+                 "confidence", "reason", "metrics", "timestamp", "id")
+    
     def __init__(self, instance_uid: str, instance_name: str, 
                 from_dc: str, to_dc: str, confidence: float, 
                 reason: str, metrics: Optional[Dict[str, Any]] = None):
@@ -305,6 +346,7 @@ class FailoverManager:
         self.decisions_history = []
         self.last_failover_time = {}  # instance_uid -> timestamp
         self.lock = threading.RLock()
+        self._stop_event = threading.Event()
     
     def initialize(self):
         """Initialize the failover manager."""
@@ -318,7 +360,7 @@ class FailoverManager:
         for instance in self.config.instances:
             self.last_failover_time[instance.uid] = 0
         
-        logger.info(f"Initialized failover manager with {self.config.failover_provider} provider")
+        logger.info("Initialized failover manager with %s provider", self.config.failover_provider)
     
     def start(self):
         """Start the decision thread."""
@@ -327,6 +369,7 @@ class FailoverManager:
             return
         
         self.running = True
+        self._stop_event.clear()
         self.decision_thread = threading.Thread(
             target=self._decision_loop,
             daemon=True
@@ -337,14 +380,16 @@ class FailoverManager:
     def stop(self):
         """Stop the decision thread."""
         self.running = False
+        self._stop_event.set()
         if self.decision_thread and self.decision_thread.is_alive():
             self.decision_thread.join(timeout=5)
         logger.info("Failover decision thread stopped")
     
     def _decision_loop(self):
         """Main loop for making failover decisions."""
-        # Initial sleep to allow health monitoring to collect data
-        time.sleep(60)
+        # Initial wait to allow health monitoring to collect data
+        if self._stop_event.wait(60):
+            return
         
         while self.running:
             try:
@@ -352,12 +397,14 @@ class FailoverManager:
                 for instance in self.config.instances:
                     self._check_instance_for_failover(instance)
                 
-                # Sleep until next check
-                time.sleep(self.config.decision_interval)
+                # Wait until next check (returns early on stop)
+                if self._stop_event.wait(self.config.decision_interval):
+                    return
             
             except Exception as e:
-                logger.error(f"Error in decision loop: {e}")
-                time.sleep(30)  # Shorter sleep on error
+                logger.error("Error in decision loop: %s", e)
+                if self._stop_event.wait(30):  # Shorter wait on error
+                    return
     
     def _check_instance_for_failover(self, instance):
         """Check if an instance requires failover."""
@@ -374,7 +421,7 @@ class FailoverManager:
         # Check if the active DC is having problems
         active_dc_status = health_status.get(active_dc)
         if not active_dc_status:
-            logger.warning(f"No health status for active DC {active_dc}")
+            logger.warning("No health status for active DC %s", active_dc)
             return
         
         # Check if the active DC can serve traffic
@@ -386,7 +433,7 @@ class FailoverManager:
         alternative_dc = self._find_best_alternative_dc(instance, health_status)
         
         if not alternative_dc:
-            logger.warning(f"No healthy alternative DC found for instance {instance.name}")
+            logger.warning("No healthy alternative DC found for instance %s", instance.name)
             return
         
         # Create failover decision
@@ -397,10 +444,10 @@ class FailoverManager:
             if self.config.auto_failover:
                 self._execute_failover(decision)
             else:
-                logger.warning(f"Automatic failover disabled. Manual intervention required: {decision.reason}")
+                logger.warning("Automatic failover disabled. Manual intervention required: %s", decision.reason)
                 self._send_manual_intervention_alert(decision)
         else:
-            logger.info(f"Failover confidence too low ({decision.confidence:.2f}): {decision.reason}")
+            logger.info("Failover confidence too low (%.2f): %s", decision.confidence, decision.reason)
     
     def _find_best_alternative_dc(self, instance, health_status):
         """Find the best alternative datacenter for failover."""
@@ -521,24 +568,10 @@ class FailoverManager:
         # Ensure confidence is between 0 and 1
         confidence = max(0.0, min(1.0, confidence))
         
-        # Create the decision object
+        # Create the decision object (statuses are already per-call copies)
         metrics = {
-            "active_dc": {
-                "status": active_status.status,
-                "latency_ms": active_status.latency_ms,
-                "memory_used_percent": active_status.memory_used_percent,
-                "hit_rate": active_status.hit_rate,
-                "consecutive_errors": active_status.consecutive_errors,
-                "can_serve_traffic": active_status.can_serve_traffic
-            },
-            "target_dc": {
-                "status": target_status.status,
-                "latency_ms": target_status.latency_ms,
-                "memory_used_percent": target_status.memory_used_percent,
-                "hit_rate": target_status.hit_rate,
-                "consecutive_errors": target_status.consecutive_errors,
-                "can_serve_traffic": target_status.can_serve_traffic
-            }
+            "active_dc": active_status.as_mapping(),
+            "target_dc": target_status.as_mapping()
         }
         
         reason = "; ".join(reasons)
@@ -555,7 +588,7 @@ class FailoverManager:
     
     def _execute_failover(self, decision):
         """Execute a failover decision."""
-        logger.info(f"Executing failover for {decision.instance_name} from {decision.from_dc} to {decision.to_dc}")
+        logger.info("Executing failover for %s from %s to %s", decision.instance_name, decision.from_dc, decision.to_dc)
         
         try:
             # Find instance info
@@ -570,7 +603,7 @@ class FailoverManager:
                     break
             
             if not instance_info:
-                logger.error(f"Instance info not found for {decision.instance_uid}")
+                logger.error("Instance info not found for %s", decision.instance_uid)
                 return False
             
             # Perform the failover
@@ -598,18 +631,31 @@ class FailoverManager:
                     if len(self.decisions_history) > 100:
                         self.decisions_history = self.decisions_history[-100:]
                 
-                logger.info(f"Failover successful for {decision.instance_name} to {decision.to_dc}")
+                logger.info("Failover successful for %s to %s", decision.instance_name, decision.to_dc)
                 return True
             else:
-                logger.error(f"Failover failed for {decision.instance_name} to {decision.to_dc}")
+                logger.error("Failover failed for %s to %s", decision.instance_name, decision.to_dc)
                 self._send_failover_alert(decision, success=False)
                 return False
         
         except Exception as e:
-            logger.error(f"Error executing failover: {e}")
+            logger.error("Error executing failover: %s", e)
             self._send_failover_alert(decision, success=False, error=str(e))
             return False
     
+    @staticmethod
+    def _alert_metrics(decision):
+        """Copy decision metrics into plain dicts for alert details.
+        
+        Threshold decisions hold read-only HealthStatus views per datacenter,
+        which the JSON and email renderers downstream of the alert history
+        cannot handle; AI decisions hold a flat monitoring sample instead.
+        """
+        return {
+            key: dict(value) if isinstance(value, Mapping) else value
+            for key, value in decision.metrics.items()
+        }
+    
     def _send_failover_alert(self, decision, success=True, error=None):
         """Send an alert about a failover event."""
         if not hasattr(self.core, "alerting"):
@@ -629,7 +675,7 @@ class FailoverManager:
             "to_dc": decision.to_dc,
             "confidence": decision.confidence,
             "reason": decision.reason,
-            "metrics": decision.metrics,
+            "metrics": self._alert_metrics(decision),
             "timestamp": decision.timestamp
         }
         
@@ -657,7 +703,7 @@ class FailoverManager:
             "to_dc": decision.to_dc,
             "confidence": decision.confidence,
             "reason": decision.reason,
-            "metrics": decision.metrics,
+            "metrics": self._alert_metrics(decision),
             "timestamp": decision.timestamp
         }
         
@@ -691,7 +737,7 @@ class FailoverManager:
                 break
         
         if not instance:
-            logger.error(f"Instance {instance_uid} not found")
+            logger.error("Instance %s not found", instance_uid)
             return False
         
         # Create decision
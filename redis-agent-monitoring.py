@@ -1,18 +1,192 @@
 #!/usr/bin/env python3
 # redis_agent/monitoring.py - Monitoring module for Redis Enterprise
 
+import array
 import logging
 import threading
 import time
 import json
+from concurrent.futures import ThreadPoolExecutor, wait
+import numpy as np
 import redis
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, asdict
 from datetime import datetime
 
+from redis_agent.core import HealthStatus
+
 logger = logging.getLogger("redis-agent.monitoring")
 
+# Number of samples kept per instance
+METRICS_HISTORY_SIZE = 1000
+
+# INFO sections and fields read on every poll, with defaults for missing fields
+INFO_SECTIONS = ("stats", "memory", "clients")
+_INFO_DEFAULTS = (
+    ("used_memory", 0),
+    ("maxmemory", 1),
+    ("keyspace_hits", 0),
+    ("keyspace_misses", 0),
+    ("connected_clients", 0),
+    ("instantaneous_ops_per_sec", 0),
+    ("rejected_connections", 0),
+    ("evicted_keys", 0),
+    ("expired_keys", 0)
+)
+_INFO_KEYS = tuple(key for key, _ in _INFO_DEFAULTS)
+
+# Multi-section INFO needs Redis 7.0; plain INFO is the fallback for older servers
+_INFO_COMMAND = ("INFO",) + INFO_SECTIONS
+_INFO_COMMAND_ALL = ("INFO",)
+
+_INFO_KEYS_RAW = {key.encode(): k for k, key in enumerate(_INFO_KEYS)}
+
+def _parse_raw_info(raw: bytes) -> Tuple[int, ...]:
+    """Parse only the monitored fields straight from a raw INFO reply."""
+    values = [default for _, default in _INFO_DEFAULTS]
+    for line in raw.split(b"\r\n"):
+        key, _, value = line.partition(b":")
+        k = _INFO_KEYS_RAW.get(key)
+        if k is not None:
+            values[k] = int(value)
+    return tuple(values)
+
+# Health thresholds, one bit each in the status mask
+LATENCY_DEGRADED_MS = 100        # bit 0
+MEMORY_DEGRADED_PERCENT = 90     # bit 1
+MEMORY_FAILING_PERCENT = 95      # bit 2
+REJECTED_CONNECTIONS_MAX = 0     # bit 3
+
+def _status_for_mask(mask: int) -> Tuple[str, bool]:
+    if not mask:
+        return "healthy", True
+    if mask & 0b1000:
+        # Rejected connections are reported as degraded even at critical memory
+        status = "degraded"
+    elif mask & 0b0100:
+        status = "failing"
+    else:
+        status = "degraded"
+    return status, not mask & 0b0100
+
+# (status, can_serve_traffic) for every combination of threshold breaches
+_STATUS_LUT = tuple(_status_for_mask(mask) for mask in range(16))
+
+class MetricsRing:
+    """Fixed-size ring buffer of metric samples for one instance.
+    
+    Samples are kept as the original dicts in preallocated slots, alongside
+    a numpy column of their timestamps for binary-searched time windows.
+    Per-field values and statistics are derived from the slots when read,
+    so a push is only a couple of slot writes.
+    
+    The ring has a single writer (the monitoring thread) and is read with a
+    seqlock instead of a mutex: readers copy a snapshot and retry if a push
+    overlapped with it.
+    """
+    
+    def __init__(self, capacity: int = METRICS_HISTORY_SIZE):
+        """Initialize an empty ring.
+        
+        Args:
+            capacity: Maximum number of samples retained
+        """
+        self.capacity = capacity
+        self.ts = np.zeros(capacity, dtype=np.float64)
+        self.samples = [None] * capacity
+        self.head = 0
+        self.count = 0
+        
+        self._seq_begin = array.array("Q", [0])
+        self._seq_end = array.array("Q", [0])
+    
+    def __len__(self):
+        return self.count
+    
+    def push(self, metrics: Dict[str, Any]):
+        """Append a sample, overwriting the oldest one when full."""
+        timestamp = float(metrics["timestamp"])
+        
+        self._seq_begin[0] += 1
+        try:
+            i = self.head
+            self.ts[i] = timestamp
+            self.samples[i] = metrics
+            
+            self.head = (i + 1) % self.capacity
+            if self.count < self.capacity:
+                self.count += 1
+        finally:
+            # Always close the write section, or readers would spin forever
+            self._seq_end[0] = self._seq_begin[0]
+    
+    def _read(self, snapshot, *args):
+        """Run a copying reader until it sees no concurrent push."""
+        while True:
+            end = self._seq_end[0]
+            result = snapshot(*args)
+            if self._seq_begin[0] == end:
+                return result
+    
+    def _order(self) -> np.ndarray:
+        """Ring slot indices in chronological order."""
+        start = (self.head - self.count) % self.capacity
+        return (start + np.arange(self.count)) % self.capacity
+    
+    def _since_index(self, cutoff_time: float) -> np.ndarray:
+        """Chronological slot indices of samples at or after cutoff_time."""
+        order = self._order()
+        return order[np.searchsorted(self.ts[order], cutoff_time, side="left"):]
+    
+    def _column(self, name: str, idx: np.ndarray) -> np.ndarray:
+        """Values of one field for the given slots, NaN where a sample lacks it."""
+        samples = self.samples
+        return np.fromiter((samples[i].get(name, np.nan) for i in idx.tolist()),
+                           dtype=np.float64, count=len(idx))
+    
+    def _latest(self, limit: int) -> List[Dict[str, Any]]:
+        return [self.samples[i] for i in self._order()[-limit:].tolist()] if limit > 0 else []
+    
+    def _since(self, cutoff_time: float) -> List[Dict[str, Any]]:
+        return [self.samples[i] for i in self._since_index(cutoff_time).tolist()]
+    
+    def _values(self, name: str, cutoff_time: float) -> Tuple[np.ndarray, np.ndarray]:
+        idx = self._since_index(cutoff_time)
+        return self.ts[idx], self._column(name, idx)
+    
+    def _all_values(self, name: str) -> np.ndarray:
+        return self._column(name, self._order())
+    
+    def stats(self, name: str) -> Dict[str, Any]:
+        """Count, mean and (population) std of a field over the ring."""
+        values = self._read(self._all_values, name)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return {"count": 0, "mean": None, "std": None}
+        return {"count": len(values), "mean": float(values.mean()), "std": float(values.std())}
+    
+    def latest(self, limit: int = 1) -> List[Dict[str, Any]]:
+        """Most recent samples, oldest first."""
+        return self._read(self._latest, limit)
+    
+    def since(self, cutoff_time: float) -> List[Dict[str, Any]]:
+        """Samples with a timestamp at or after cutoff_time, oldest first."""
+        return self._read(self._since, cutoff_time)
+    
+    def values(self, name: str, cutoff_time: float = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamps and values of a numeric field as arrays.
+        
+        Args:
+            name: Numeric field name, e.g. "latency_ms"
+            cutoff_time: Only include samples at or after this time
+            
+        Returns:
+            Tuple of (timestamps, values) arrays in chronological order
+        """
+        return self._read(self._values, name, cutoff_time)
+
 class RedisMonitor:
     """Monitor Redis Enterprise instances for health and performance"""
     
@@ -26,10 +200,17 @@ class RedisMonitor:
         self.config = core_agent.config
         self.clients = {}  # instance_uid -> dict of DC -> Redis client
         self.api_sessions = {}  # DC name -> requests Session
-        self.metrics_history = {}  # instance_uid -> list of metrics
+        self._api_cache = {}  # (instance_uid, DC name) -> (validators, api_metrics)
+        self.metrics_history = {}  # instance_uid -> MetricsRing
         self.monitoring_thread = None
         self.running = False
-        self.lock = threading.RLock()
+        self._stop_event = threading.Event()
+        
+        # Shared pool for per-instance polling, bounded by instance count
+        self._pool = None
+        self._pool_size = min(32, max(1, len(self.config.instances)))
+        self._in_flight = {}  # instance_uid -> Future of its latest poll
+        self._info_commands = {}  # (instance_uid, DC name) -> INFO command, if not _INFO_COMMAND
     
     def initialize(self):
         """Initialize Redis clients and API sessions."""
@@ -38,7 +219,7 @@ class RedisMonitor:
         
         # Initialize metrics history
         for instance in self.config.instances:
-            self.metrics_history[instance.uid] = []
+            self.metrics_history[instance.uid] = MetricsRing()
     
     def _init_redis_clients(self):
         """Initialize Redis clients for all instances and datacenters."""
@@ -48,15 +229,7 @@ class RedisMonitor:
             for dc_name, endpoint in instance.endpoints.items():
                 try:
                     # Create Redis client
-                    client = redis.Redis(
-                        host=endpoint["host"],
-                        port=endpoint["port"],
-                        password=instance.password,
-                        socket_timeout=5.0,
-                        socket_connect_timeout=3.0,
-                        health_check_interval=30,
-                        decode_responses=True
-                    )
+                    client = self._create_redis_client(instance, endpoint)
                     
                     # Test connection
                     client.ping()
@@ -68,18 +241,57 @@ class RedisMonitor:
                 except Exception as e:
                     logger.error(f"Failed to connect to Redis instance {instance.name} in datacenter {dc_name}: {e}")
     
+    def _create_redis_client(self, instance, endpoint: Dict[str, Any]):
+        """Create a Redis client for one instance endpoint.
+        
+        Each client is only ever used by the task polling its instance, so it
+        holds a single dedicated connection instead of a pool. Replies are
+        left as bytes; _poll_endpoint parses INFO fields directly.
+        """
+        return redis.Redis(
+            host=endpoint["host"],
+            port=endpoint["port"],
+            password=instance.password,
+            socket_timeout=5.0,
+            socket_connect_timeout=3.0,
+            health_check_interval=30,
+            client_name=f"redis-agent-{instance.uid}",
+            single_connection_client=True,
+            decode_responses=False
+        )
+    
     def _init_api_sessions(self):
         """Initialize Redis Enterprise API sessions for all datacenters."""
+        # One pooled connection per monitored database keeps polls on warm
+        # keep-alive connections instead of a new TLS handshake per request
+        pool_size = max(10, len(self.config.instances))
+        
         for dc_name, dc_config in self.config.datacenters.items():
             try:
                 session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=1,  # one API host per datacenter session
+                    pool_maxsize=pool_size,
+                    # Hand the last 5xx back to the status checks instead of raising
+                    max_retries=Retry(
+                        total=2,
+                        backoff_factor=0.1,
+                        status_forcelist=(502, 503, 504),
+                        raise_on_status=False,
+                    )
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["Connection"] = "keep-alive"
+                session.verify = False
+                
                 # Add authentication if available
                 if "api_user" in dc_config and "api_password" in dc_config:
                     session.auth = (dc_config["api_user"], dc_config["api_password"])
                 
                 # Test connection if API URL is provided
                 if "api_url" in dc_config:
-                    response = session.get(f"{dc_config['api_url']}/v1/cluster", verify=False)
+                    response = session.get(f"{dc_config['api_url']}/v1/cluster")
                     if response.status_code == 200:
                         logger.info(f"Connected to Redis Enterprise API in datacenter {dc_name}")
                     else:
@@ -98,6 +310,8 @@ class RedisMonitor:
             return
         
         self.running = True
+        self._stop_event.clear()
+        self._pool = ThreadPoolExecutor(max_workers=self._pool_size, thread_name_prefix="redis-monitor")
         self.monitoring_thread = threading.Thread(
             target=self._monitoring_loop,
             daemon=True
@@ -108,79 +322,147 @@ class RedisMonitor:
     def stop(self):
         """Stop the monitoring thread."""
         self.running = False
+        self._stop_event.set()
         if self.monitoring_thread and self.monitoring_thread.is_alive():
             self.monitoring_thread.join(timeout=5)
+        if self._pool:
+            self._pool.shutdown(wait=False)
         logger.info("Redis monitoring thread stopped")
     
     def _monitoring_loop(self):
-        """Main monitoring loop."""
+        """Main monitoring loop.
+        
+        Ticks are scheduled on absolute deadlines (start + n * interval) so the
+        sampling period does not drift by the time each tick takes; a tick that
+        overruns skips the slots it missed instead of bunching up samples.
+        """
+        interval = self.config.monitoring_interval
+        next_tick = time.monotonic()
         while self.running:
             try:
-                # Monitor all instances
-                for instance in self.config.instances:
-                    self._monitor_instance(instance)
+                # Monitor all instances concurrently
+                self._tick()
                 
-                # Sleep until next interval
-                time.sleep(self.config.monitoring_interval)
+                # Wait until the next scheduled tick
+                next_tick += interval
+                now = time.monotonic()
+                if next_tick < now:
+                    next_tick += ((now - next_tick) // interval + 1) * interval
+                if self._stop_event.wait(next_tick - now):
+                    break
             
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(5)  # Shorter sleep on error to recover faster
+                # Shorter wait on error to recover faster, then restart the schedule
+                if self._stop_event.wait(5):
+                    break
+                next_tick = time.monotonic()
+    
+    def _tick(self):
+        """Poll every instance once, overlapping their network round-trips.
+        
+        Each instance is polled on the shared thread pool, so a slow endpoint
+        only delays (and is only charged to) its own instance. An instance
+        whose previous poll is still running is skipped so its metrics ring
+        keeps exactly one writer.
+        """
+        futures = []
+        for instance in self.config.instances:
+            previous = self._in_flight.get(instance.uid)
+            if previous is not None and not previous.done():
+                logger.warning(f"Previous poll for {instance.name} still running; skipping this tick")
+                continue
+            future = self._pool.submit(self._monitor_instance, instance)
+            self._in_flight[instance.uid] = future
+            futures.append(future)
+        
+        wait(futures, timeout=self.config.monitoring_interval)
+    
+    def _get_client(self, instance, dc_name: str, endpoint: Dict[str, Any]):
+        """Get the Redis client for an instance/DC, reconnecting if needed."""
+        # Skip if no client for this instance/DC
+        if (instance.uid not in self.clients or 
+            dc_name not in self.clients[instance.uid]):
+            return None
+        
+        client = self.clients[instance.uid][dc_name]
+        
+        # Try to reconnect if needed
+        if not hasattr(client, "connection") or client.connection is None:
+            try:
+                client = self._create_redis_client(instance, endpoint)
+                self.clients[instance.uid][dc_name] = client
+            except Exception as e:
+                logger.error(f"Failed to reconnect to {instance.name} in {dc_name}: {e}")
+                return None
+        
+        return client
+    
+    def _poll_endpoint(self, client, key: Tuple[str, str]) -> Tuple[Any, bytes, float]:
+        """PING and INFO one endpoint in a single round-trip.
+        
+        Both commands are written before either reply is read. Latency is
+        taken as soon as the PING reply is parsed, so it covers the PING
+        round-trip only and not the server's time spent building INFO.
+        
+        INFO with several sections needs Redis 7.0; an endpoint that rejects
+        it is switched to plain INFO for this and every later poll.
+        
+        Args:
+            client: Redis client for the endpoint
+            key: (instance_uid, dc_name) of the endpoint
+            
+        Returns:
+            Tuple of (ping_result, raw_info, latency_ms)
+        """
+        conn = client.connection
+        info_command = self._info_commands.get(key, _INFO_COMMAND)
+        try:
+            # Connect first so a reconnect isn't counted as latency
+            conn.connect()
+            start_time = time.time()
+            conn.send_packed_command(conn.pack_commands([("PING",), info_command]))
+            ping_result = client.parse_response(conn, "PING")
+            latency_ms = (time.time() - start_time) * 1000
+            try:
+                # Raw bytes: skip redis-py's full INFO parse
+                info = conn.read_response()
+            except redis.ResponseError:
+                if info_command == _INFO_COMMAND_ALL:
+                    raise
+                logger.info(f"Endpoint {key[0]} in {key[1]} rejected multi-section INFO; using plain INFO")
+                self._info_commands[key] = _INFO_COMMAND_ALL
+                conn.send_command(*_INFO_COMMAND_ALL)
+                info = conn.read_response()
+        except Exception:
+            # Drop the connection so an unread reply can't leak into the next poll
+            conn.disconnect()
+            raise
+        return ping_result, info, latency_ms
     
     def _monitor_instance(self, instance):
         """Monitor a specific Redis instance across all datacenters."""
         for dc_name, endpoint in instance.endpoints.items():
             try:
-                # Skip if no client for this instance/DC
-                if (instance.uid not in self.clients or 
-                    dc_name not in self.clients[instance.uid]):
+                client = self._get_client(instance, dc_name, endpoint)
+                if client is None:
                     continue
                 
-                client = self.clients[instance.uid][dc_name]
-                
-                # Try to reconnect if needed
-                if not hasattr(client, "connection") or client.connection is None:
-                    try:
-                        client = redis.Redis(
-                            host=endpoint["host"],
-                            port=endpoint["port"],
-                            password=instance.password,
-                            socket_timeout=5.0,
-                            socket_connect_timeout=3.0,
-                            decode_responses=True
-                        )
-                        self.clients[instance.uid][dc_name] = client
-                    except Exception as e:
-                        logger.error(f"Failed to reconnect to {instance.name} in {dc_name}: {e}")
-                        continue
-                
-                # Measure response time
-                start_time = time.time()
-                ping_result = client.ping()
-                latency_ms = (time.time() - start_time) * 1000
+                ping_result, info, latency_ms = self._poll_endpoint(client, (instance.uid, dc_name))
                 
                 if not ping_result:
                     # Failed to ping
                     self._update_error_status(instance.uid, dc_name, "Failed to ping Redis")
                     continue
                 
-                # Get Redis INFO
-                info = client.info()
-                
                 # Extract key metrics
-                used_memory = int(info.get("used_memory", 0))
-                maxmemory = int(info.get("maxmemory", 1))
+                (used_memory, maxmemory, hits, misses, connected_clients, ops_per_second,
+                 rejected_connections, evicted_keys, expired_keys) = _parse_raw_info(info)
                 memory_percent = (used_memory / maxmemory * 100) if maxmemory > 0 else 0
                 
                 # Redis hits/misses
-                hits = int(info.get("keyspace_hits", 0))
-                misses = int(info.get("keyspace_misses", 0))
                 hit_rate = hits / (hits + misses) if hits + misses > 0 else 0
                 
-                # Get other metrics
-                connected_clients = int(info.get("connected_clients", 0))
-                ops_per_second = int(info.get("instantaneous_ops_per_sec", 0))
-                
                 # Get additional metrics from Redis Enterprise API if available
                 api_metrics = self._get_api_metrics(instance.uid, dc_name)
                 
@@ -199,21 +481,17 @@ class RedisMonitor:
                     "misses": misses,
                     "ops_per_second": ops_per_second,
                     "connected_clients": connected_clients,
-                    "rejected_connections": int(info.get("rejected_connections", 0)),
-                    "evicted_keys": int(info.get("evicted_keys", 0)),
-                    "expired_keys": int(info.get("expired_keys", 0)),
+                    "rejected_connections": rejected_connections,
+                    "evicted_keys": evicted_keys,
+                    "expired_keys": expired_keys,
                 }
                 
                 # Add API metrics if available
                 if api_metrics:
                     metrics.update(api_metrics)
                 
-                # Store metrics
-                with self.lock:
-                    self.metrics_history[instance.uid].append(metrics)
-                    # Limit history size (keep last 1000 samples)
-                    if len(self.metrics_history[instance.uid]) > 1000:
-                        self.metrics_history[instance.uid] = self.metrics_history[instance.uid][-1000:]
+                # Store metrics (single writer; readers use the ring's seqlock)
+                self.metrics_history[instance.uid].push(metrics)
                 
                 # Update health status based on metrics
                 health_status = self._calculate_health_status(metrics)
@@ -229,8 +507,6 @@ class RedisMonitor:
     
     def _update_error_status(self, instance_uid: str, dc_name: str, error_message: str):
         """Update instance health status with an error."""
-        from redis_agent.core import HealthStatus
-        
         status = HealthStatus(
             status="failed",
             can_serve_traffic=False,
@@ -243,8 +519,6 @@ class RedisMonitor:
     
     def _calculate_health_status(self, metrics: Dict[str, Any]):
         """Calculate health status based on metrics."""
-        from redis_agent.core import HealthStatus
-        
         # Create basic health status
         status = HealthStatus(
             latency_ms=metrics["latency_ms"],
@@ -256,32 +530,12 @@ class RedisMonitor:
             consecutive_errors=0
         )
         
-        # Determine status based on thresholds
-        is_healthy = True
-        
-        # Check latency
-        if metrics["latency_ms"] > 100:  # More than 100ms
-            is_healthy = False
-            status.status = "degraded"
-        
-        # Check memory usage
-        if metrics["memory_used_percent"] > 90:  # More than 90%
-            is_healthy = False
-            status.status = "degraded"
-            
-            # Critical if above 95%
-            if metrics["memory_used_percent"] > 95:
-                status.status = "failing"
-                status.can_serve_traffic = False
-        
-        # Check rejected connections
-        if metrics["rejected_connections"] > 0:
-            is_healthy = False
-            status.status = "degraded"
-        
-        # Set status to healthy if everything is good
-        if is_healthy:
-            status.status = "healthy"
+        # Determine status with a single table lookup on the breached thresholds
+        mask = ((metrics["latency_ms"] > LATENCY_DEGRADED_MS)
+                | (metrics["memory_used_percent"] > MEMORY_DEGRADED_PERCENT) << 1
+                | (metrics["memory_used_percent"] > MEMORY_FAILING_PERCENT) << 2
+                | (metrics["rejected_connections"] > REJECTED_CONNECTIONS_MAX) << 3)
+        status.status, status.can_serve_traffic = _STATUS_LUT[mask]
         
         return status
     
@@ -296,22 +550,22 @@ class RedisMonitor:
             if "api_url" not in dc_config:
                 return {}
             
-            # Find the database UID for this instance
-            db_uid = None
-            for instance in self.config.instances:
-                if instance.uid == instance_uid:
-                    db_uid = instance.uid
-                    break
-            
-            if not db_uid:
-                return {}
+            # The instance UID is the Redis Enterprise database UID
+            db_uid = instance_uid
             
             # Make API request
             session = self.api_sessions[dc_name]
             api_url = dc_config["api_url"]
             
-            # Try to get database stats
-            response = session.get(f"{api_url}/v1/bdbs/{db_uid}/stats?interval=1sec", verify=False)
+            # Try to get database stats, revalidating the previous response if any
+            cache_key = (instance_uid, dc_name)
+            cached = self._api_cache.get(cache_key)
+            headers = cached[0] if cached else None
+            response = session.get(f"{api_url}/v1/bdbs/{db_uid}/stats?interval=1sec", headers=headers)
+            
+            if response.status_code == 304 and cached:
+                # No new interval since the last poll
+                return cached[1]
             
             if response.status_code != 200:
                 logger.warning(f"Failed to get API metrics for {instance_uid} in {dc_name}: {response.status_code}")
@@ -342,6 +596,14 @@ class RedisMonitor:
                     if src_key in latest:
                         api_metrics[dest_key] = latest[src_key]
             
+            # Remember validators for a conditional request next time
+            validators = {}
+            if "ETag" in response.headers:
+                validators["If-None-Match"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                validators["If-Modified-Since"] = response.headers["Last-Modified"]
+            self._api_cache[cache_key] = (validators or None, api_metrics)
+            
             return api_metrics
             
         except Exception as e:
@@ -350,22 +612,35 @@ class RedisMonitor:
     
     def get_latest_metrics(self, instance_uid: str, limit: int = 1) -> List[Dict[str, Any]]:
         """Get the latest metrics for an instance."""
-        with self.lock:
-            if instance_uid in self.metrics_history:
-                return self.metrics_history[instance_uid][-limit:]
+        ring = self.metrics_history.get(instance_uid)
+        if ring is None:
             return []
+        return ring.latest(limit)
     
     def get_metrics_history(self, instance_uid: str, minutes: int = 60) -> List[Dict[str, Any]]:
         """Get metrics history for an instance for the specified time window."""
-        with self.lock:
-            if instance_uid not in self.metrics_history:
-                return []
-            
-            # Calculate cutoff time
-            cutoff_time = time.time() - (minutes * 60)
-            
-            # Filter metrics by timestamp
-            return [
-                m for m in self.metrics_history[instance_uid]
-                if m["timestamp"] >= cutoff_time
-            ]
+        ring = self.metrics_history.get(instance_uid)
+        if ring is None:
+            return []
+        
+        # Calculate cutoff time
+        cutoff_time = time.time() - (minutes * 60)
+        
+        # Binary search on the ordered timestamps
+        return ring.since(cutoff_time)
+    
+    def get_metric_statistics(self, instance_uid: str, metric_name: str) -> Dict[str, Any]:
+        """Get count/mean/std of a metric over the retained history."""
+        ring = self.metrics_history.get(instance_uid)
+        if ring is None:
+            return {"count": 0, "mean": None, "std": None}
+        return ring.stats(metric_name)
+    
+    def get_metric_values(self, instance_uid: str, metric_name: str, minutes: int = 60) -> Tuple[np.ndarray, np.ndarray]:
+        """Get timestamps and values of one numeric metric as numpy arrays."""
+        ring = self.metrics_history.get(instance_uid)
+        if ring is None:
+            return np.empty(0), np.empty(0)
+        
+        cutoff_time = time.time() - (minutes * 60)
+        return ring.values(metric_name, cutoff_time)
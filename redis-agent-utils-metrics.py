@@ -4,7 +4,34 @@
 import time
 import math
 import numpy as np
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+
+# Numba is optional; analyze_metric falls back to plain NumPy without it
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Fixed field order for vectorized normalization, with per-field defaults.
+# Fields listed in _THRESHOLD_KEYS may be overridden by the caller's thresholds;
+# memory is a percentage and hit rate is already a 0-1 ratio.
+_METRIC_KEYS = (
+    "latency_ms",
+    "memory_used_percent",
+    "hit_rate",
+    "ops_per_second",
+    "connected_clients",
+    "rejected_connections",
+    "evicted_keys",
+    "avg_latency",       # Redis Enterprise specific
+    "total_req",         # Redis Enterprise specific
+)
+_DEFAULT_DIVISORS = (100.0, 100.0, 1.0, 10000.0, 1000.0, 10.0, 1000.0, 10.0, 10000.0)
+_THRESHOLD_KEYS = frozenset(_METRIC_KEYS) - {"memory_used_percent", "hit_rate"}
+# Fields capped at 1.0 (memory and hit rate are passed through unclipped)
+_CLIP_MASK = np.array([k in _THRESHOLD_KEYS for k in _METRIC_KEYS])
+# Hit rate is inverted so 1 is bad (0% hit rate)
+_INVERT_MASK = np.array([k == "hit_rate" for k in _METRIC_KEYS])
 
 def normalize_metrics(metrics: Dict[str, Any], thresholds: Dict[str, float]) -> Dict[str, float]:
     """
@@ -17,52 +44,20 @@ def normalize_metrics(metrics: Dict[str, Any], thresholds: Dict[str, float]) ->
     Returns:
         Dictionary of normalized metrics
     """
-    normalized = {}
-    
-    # Response time (0-1 where 1 is bad)
-    if "latency_ms" in metrics:
-        latency_threshold = thresholds.get("latency_ms", 100)
-        normalized["latency_ms"] = min(1.0, metrics["latency_ms"] / latency_threshold)
-    
-    # Memory usage (0-1 where 1 is 100% used)
-    if "memory_used_percent" in metrics:
-        normalized["memory_used_percent"] = metrics["memory_used_percent"] / 100.0
-    
-    # Hit rate (0-1 where 1 is 100% hit rate, inverted for anomaly detection)
-    if "hit_rate" in metrics:
-        # Invert so 1 is bad (0% hit rate)
-        normalized["hit_rate"] = 1.0 - metrics["hit_rate"]
-    
-    # Operations per second (normalize to 0-1)
-    if "ops_per_second" in metrics:
-        ops_threshold = thresholds.get("ops_per_second", 10000)
-        normalized["ops_per_second"] = min(1.0, metrics["ops_per_second"] / ops_threshold)
-    
-    # Connected clients (normalize to 0-1)
-    if "connected_clients" in metrics:
-        clients_threshold = thresholds.get("connected_clients", 1000)
-        normalized["connected_clients"] = min(1.0, metrics["connected_clients"] / clients_threshold)
-    
-    # Rejected connections (any > 0 is bad)
-    if "rejected_connections" in metrics:
-        rejected_threshold = thresholds.get("rejected_connections", 10)
-        normalized["rejected_connections"] = min(1.0, metrics["rejected_connections"] / rejected_threshold)
-    
-    # Evicted keys (normalize to 0-1)
-    if "evicted_keys" in metrics:
-        evicted_threshold = thresholds.get("evicted_keys", 1000)
-        normalized["evicted_keys"] = min(1.0, metrics["evicted_keys"] / evicted_threshold)
-    
-    # Redis Enterprise specific metrics
-    if "avg_latency" in metrics:
-        avg_latency_threshold = thresholds.get("avg_latency", 10)
-        normalized["avg_latency"] = min(1.0, metrics["avg_latency"] / avg_latency_threshold)
-    
-    if "total_req" in metrics:
-        total_req_threshold = thresholds.get("total_req", 10000)
-        normalized["total_req"] = min(1.0, metrics["total_req"] / total_req_threshold)
-    
-    return normalized
+    n = len(_METRIC_KEYS)
+    values = np.fromiter((metrics.get(k, np.nan) for k in _METRIC_KEYS), dtype=np.float64, count=n)
+    divisors = np.fromiter(
+        (thresholds.get(k, d) if k in _THRESHOLD_KEYS else d
+         for k, d in zip(_METRIC_KEYS, _DEFAULT_DIVISORS)),
+        dtype=np.float64, count=n
+    )
+    
+    # Scale, cap and invert all fields in a single pass
+    ratios = values / divisors
+    np.minimum(ratios, 1.0, out=ratios, where=_CLIP_MASK)
+    ratios = np.where(_INVERT_MASK, 1.0 - ratios, ratios)
+    
+    return {k: v for k, v in zip(_METRIC_KEYS, ratios.tolist()) if k in metrics}
 
 def calculate_metric_trend(metrics_history: List[Dict[str, Any]], metric_name: str, window_minutes: int = 30) -> Optional[float]:
     """
@@ -104,18 +99,21 @@ def calculate_metric_trend(metrics_history: List[Dict[str, Any]], metric_name: s
         return None
     
     # Convert timestamps to minutes from now for better scale
-    minutes_ago = [(now - ts) / 60 for ts in timestamps]
+    minutes_ago = (now - np.asarray(timestamps, dtype=np.float64)) / 60
+    y = np.asarray(values, dtype=np.float64)
     
-    # Calculate trend using numpy
-    try:
-        slope, _ = np.polyfit(minutes_ago, values, 1)
-        
-        # Negate slope because we're using minutes ago (descending)
-        return -slope
-    except:
+    # Closed-form least-squares slope (mean-centered for numerical stability)
+    x_centered = minutes_ago - minutes_ago.mean()
+    denominator = (x_centered * x_centered).sum()
+    if denominator == 0:
         return None
+    slope = (x_centered * (y - y.mean())).sum() / denominator
+    
+    # Negate slope because we're using minutes ago (descending)
+    return float(-slope)
 
-def detect_metric_anomalies(metrics_history: List[Dict[str, Any]], metric_name: str, z_threshold: float = 3.0) -> List[Dict[str, Any]]:
+def detect_metric_anomalies(metrics_history: List[Dict[str, Any]], metric_name: str, z_threshold: float = 3.0,
+                            mean: Optional[float] = None, std: Optional[float] = None) -> List[Dict[str, Any]]:
     """
     Detect anomalies in a specific metric using z-score.
     
@@ -123,6 +121,8 @@ def detect_metric_anomalies(metrics_history: List[Dict[str, Any]], metric_name:
         metrics_history: List of metric dictionaries
         metric_name: Name of the metric to analyze
         z_threshold: Z-score threshold for anomaly detection
+        mean: Precomputed mean (e.g. running stats from the monitor), optional
+        std: Precomputed standard deviation, optional
         
     Returns:
         List of anomalous metrics with z-scores
@@ -130,41 +130,37 @@ def detect_metric_anomalies(metrics_history: List[Dict[str, Any]], metric_name:
     if not metrics_history or len(metrics_history) < 10:
         return []
     
-    # Extract values
-    values = []
-    
-    for metric in metrics_history:
-        if metric_name in metric:
-            values.append(metric[metric_name])
+    # Extract values with their timestamps
+    samples = [metric for metric in metrics_history if metric_name in metric]
     
     # Need enough data points
-    if len(values) < 10:
+    if len(samples) < 10:
         return []
     
-    # Calculate mean and standard deviation
-    mean = np.mean(values)
-    std = np.std(values)
+    values = np.fromiter((m[metric_name] for m in samples), dtype=np.float64, count=len(samples))
+    
+    # Calculate mean and standard deviation unless running stats were supplied
+    if mean is None or std is None:
+        mean = values.mean()
+        std = values.std()
     
     # If std is too small, avoid division by zero
     if std < 0.0001:
         return []
     
     # Find anomalies
-    anomalies = []
-    
-    for metric in metrics_history:
-        if metric_name in metric:
-            z_score = abs(metric[metric_name] - mean) / std
-            
-            if z_score > z_threshold:
-                anomalies.append({
-                    "timestamp": metric["timestamp"],
-                    "value": metric[metric_name],
-                    "z_score": z_score,
-                    "metric": metric_name
-                })
-    
-    return anomalies
+    z_scores = np.abs(values - mean) / std
+    anomalous = np.flatnonzero(z_scores > z_threshold)
+    
+    return [
+        {
+            "timestamp": samples[i]["timestamp"],
+            "value": samples[i][metric_name],
+            "z_score": float(z_scores[i]),
+            "metric": metric_name
+        }
+        for i in anomalous.tolist()
+    ]
 
 def calculate_metric_statistics(metrics_history: List[Dict[str, Any]], metric_name: str) -> Dict[str, float]:
     """
@@ -234,21 +230,175 @@ def smooth_metric_data(metrics_history: List[Dict[str, Any]], metric_name: str,
         return []
     
     # Extract values
-    values = []
+    values = np.fromiter(
+        (metric[metric_name] for metric in metrics_history if metric_name in metric),
+        dtype=np.float64
+    )
     
-    for metric in metrics_history:
-        if metric_name in metric:
-            values.append(metric[metric_name])
+    # Apply trailing moving average via prefix sums (shorter windows at the start)
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+    end = np.arange(1, len(values) + 1)
+    start = np.maximum(0, end - window_size)
     
-    # Apply moving average
-    smoothed = []
+    return ((cumsum[end] - cumsum[start]) / (end - start)).tolist()
+
+class AnalysisResult(NamedTuple):
+    """Combined statistics, trend, anomalies and smoothing for one metric series."""
+    count: int
+    mean: Optional[float]
+    std: Optional[float]
+    min: Optional[float]
+    max: Optional[float]
+    median: Optional[float]
+    slope: Optional[float]       # change per minute
+    anomaly_idx: np.ndarray      # indices with |z| > z_threshold
+    z_scores: np.ndarray
+    smoothed: np.ndarray         # trailing moving average
+
+def _analyze_loop(values, times, z_threshold, window_size):
+    """Single traversal computing everything analyze_metric needs except the median.
     
-    for i in range(len(values)):
-        start_idx = max(0, i - window_size + 1)
-        window = values[start_idx:i+1]
-        smoothed.append(sum(window) / len(window))
+    Returns (mean, std, min, max, slope, z_scores, anomaly_idx, smoothed); slope
+    is NaN when the timestamps have no spread.
+    """
+    n = values.shape[0]
+    smoothed = np.empty(n)
+    mean = 0.0
+    m2 = 0.0
+    t_mean = 0.0
+    t_m2 = 0.0
+    co_moment = 0.0
+    v_min = values[0]
+    v_max = values[0]
+    window_sum = 0.0
+    
+    # Welford mean/variance, regression co-moments, extremes and moving average
+    for i in range(n):
+        v = values[i]
+        t = times[i] / 60.0
+        k = i + 1
+        dt = t - t_mean
+        t_mean += dt / k
+        dv = v - mean
+        mean += dv / k
+        m2 += dv * (v - mean)
+        t_m2 += dt * (t - t_mean)
+        co_moment += dt * (v - mean)
+        if v < v_min:
+            v_min = v
+        if v > v_max:
+            v_max = v
+        window_sum += v
+        if i >= window_size:
+            window_sum -= values[i - window_size]
+        smoothed[i] = window_sum / min(k, window_size)
+    
+    std = np.sqrt(m2 / n)
+    slope = co_moment / t_m2 if t_m2 > 0 else np.nan
+    
+    # Z-scores (same minimum sample count and std floor as detect_metric_anomalies)
+    z_scores = np.zeros(n)
+    anomaly_idx = np.empty(n, dtype=np.int64)
+    n_anomalies = 0
+    if n >= 10 and std >= 0.0001:
+        for i in range(n):
+            z = abs(values[i] - mean) / std
+            z_scores[i] = z
+            if z > z_threshold:
+                anomaly_idx[n_anomalies] = i
+                n_anomalies += 1
+    
+    return mean, std, v_min, v_max, slope, z_scores, anomaly_idx[:n_anomalies], smoothed
+
+# Compiled kernel when Numba is available. NaN/inf semantics are kept (no
+# 'nnan'/'ninf' fast-math flags) since ring columns use NaN for missing samples.
+_analyze_kernel = (
+    njit(cache=True, fastmath={"reassoc", "contract", "arcp", "nsz"}, boundscheck=False)(_analyze_loop)
+    if njit is not None else None
+)
+
+def analyze_metric(values: np.ndarray, times: np.ndarray, z_threshold: float = 3.0, window_size: int = 5) -> AnalysisResult:
+    """
+    Compute statistics, trend, z-score anomalies and smoothing in one pass.
     
-    return smoothed
+    Equivalent to calculate_metric_statistics, calculate_metric_trend,
+    detect_metric_anomalies and smooth_metric_data on the same series, but
+    works on arrays (e.g. from RedisMonitor.get_metric_values) and shares the
+    intermediate results between them.
+    
+    Args:
+        values: Metric values in chronological order
+        times: Matching timestamps (seconds)
+        z_threshold: Z-score threshold for anomaly detection
+        window_size: Size of the moving average window
+        
+    Returns:
+        AnalysisResult for the series
+    """
+    values = np.asarray(values, dtype=np.float64)
+    times = np.asarray(times, dtype=np.float64)
+    n = len(values)
+    empty = np.empty(0)
+    
+    if n == 0:
+        return AnalysisResult(0, None, None, None, None, None, None, np.empty(0, dtype=np.intp), empty, empty)
+    
+    if _analyze_kernel is not None:
+        mean, std, v_min, v_max, slope, z_scores, anomaly_idx, smoothed = _analyze_kernel(
+            values, times, float(z_threshold), int(window_size)
+        )
+        return AnalysisResult(
+            count=n,
+            mean=float(mean),
+            std=float(std),
+            min=float(v_min),
+            max=float(v_max),
+            median=float(np.median(values)),
+            slope=None if np.isnan(slope) else float(slope),
+            anomaly_idx=anomaly_idx,
+            z_scores=z_scores,
+            smoothed=smoothed
+        )
+    
+    mean = values.mean()
+    deviation = values - mean
+    std = np.sqrt((deviation * deviation).mean())
+    
+    # Trend (least-squares slope against time, per minute)
+    slope = None
+    if n >= 2:
+        minutes = times / 60
+        x_centered = minutes - minutes.mean()
+        denominator = (x_centered * x_centered).sum()
+        if denominator > 0:
+            slope = float((x_centered * deviation).sum() / denominator)
+    
+    # Z-score anomalies (same minimum sample count and std floor as detect_metric_anomalies)
+    if n >= 10 and std >= 0.0001:
+        z_scores = np.abs(deviation) / std
+        anomaly_idx = np.flatnonzero(z_scores > z_threshold)
+    else:
+        z_scores = np.zeros(n)
+        anomaly_idx = np.empty(0, dtype=np.intp)
+    
+    # Trailing moving average via prefix sums
+    cumsum = np.concatenate(([0.0], np.cumsum(values)))
+    end = np.arange(1, n + 1)
+    start = np.maximum(0, end - window_size)
+    smoothed = (cumsum[end] - cumsum[start]) / (end - start)
+    
+    return AnalysisResult(
+        count=n,
+        mean=float(mean),
+        std=float(std),
+        min=float(values.min()),
+        max=float(values.max()),
+        median=float(np.median(values)),
+        slope=slope,
+        anomaly_idx=anomaly_idx,
+        z_scores=z_scores,
+        smoothed=smoothed
+    )
 
 def downsample_metrics(metrics_history: List[Dict[str, Any]], target_points: int) -> List[Dict[str, Any]]:
     """
@@ -264,17 +414,13 @@ def downsample_metrics(metrics_history: List[Dict[str, Any]], target_points: int
     if not metrics_history or len(metrics_history) <= target_points:
         return metrics_history
     
-    # Calculate step size
-    step = len(metrics_history) / target_points
-    
-    # Select points
-    downsampled = []
-    
-    for i in range(target_points):
-        idx = min(len(metrics_history) - 1, int(i * step))
-        downsampled.append(metrics_history[idx])
+    # Evenly spaced indices (floor of i * N / target), computed in one shot.
+    # Exact integer arithmetic, so where the float step i * (N / target)
+    # rounded just below a whole number this picks the next point instead
+    # (e.g. N=30, target=22: index 15 rather than 14 for i=11).
+    indices = (np.arange(target_points) * len(metrics_history)) // target_points
     
-    return downsampled
+    return [metrics_history[i] for i in indices.tolist()]
 
 def format_metrics_for_chart(metrics_history: List[Dict[str, Any]], metric_name: str) -> Dict[str, List]:
     """
@@ -3,148 +3,670 @@
 
 import os
 import json
-from typing import Dict, Any, Optional
+import mmap
+import logging
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Tuple, List, Callable, Mapping, MutableMapping, MutableSequence, NamedTuple
 from pathlib import Path
 
-def load_config(config_path: str) -> Dict[str, Any]:
+# orjson (or ujson) is optional; load_config falls back to the stdlib parser.
+# All three accept bytes, so the file is always read in binary mode.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    try:
+        import ujson
+        _loads = ujson.loads
+    except ImportError:
+        _loads = json.loads
+
+# ijson is optional; without it large files take the in-memory path too
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# fastjsonschema is optional; without it configs are checked by the section validators
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
+logger = logging.getLogger("redis-agent.config")
+
+# With orjson, files larger than this are parsed straight from a memory map
+MMAP_THRESHOLD = 64 * 1024
+
+# Otherwise files larger than this are stream-parsed one top-level section at a time
+STREAM_PARSE_THRESHOLD = 1024 * 1024
+
+# Environment variable naming the config file when get_config has no path
+CONFIG_PATH_ENV = "AGENT_CONFIG"
+
+# Frozen parsed configs keyed by absolute path; each entry carries the
+# (st_mtime_ns, st_size) stamp it was parsed from so edits invalidate it.
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Mapping[str, Any]]] = {}
+
+# (section, key, environment variable) overrides applied by apply_env_overrides
+_ENV_MAP = (
+    ("azure_openai", "api_key", "AZURE_OPENAI_API_KEY"),
+    ("azure_openai", "endpoint", "AZURE_OPENAI_ENDPOINT"),
+    ("elk", "url", "ELASTICSEARCH_URL"),
+    ("elk", "username", "ELASTICSEARCH_USERNAME"),
+    ("elk", "password", "ELASTICSEARCH_PASSWORD"),
+    ("dns_config", "aws_access_key", "AWS_ACCESS_KEY_ID"),
+    ("dns_config", "aws_secret_key", "AWS_SECRET_ACCESS_KEY"),
+    ("dns_config", "aws_region", "AWS_REGION"),
+    ("api", "api_key", "API_KEY"),
+)
+
+def _build_env_applier(env_map) -> Callable[[Dict[str, Any], Mapping[str, str]], None]:
+    """
+    Generate a straight-line function that applies the given overrides.
+    
+    Section and variable names are inlined as constants, each section is
+    bound to a local with a single lookup and mutated through it, and
+    environ.get is bound once, so no table is walked at call time. A
+    frozen section is swapped for a mutable copy before its first write.
+    
+    Args:
+        env_map: (section, key, environment variable) entries
+        
+    Returns:
+        Function taking (config, environ) that updates config in place
+    """
+    by_section: Dict[str, List[Tuple[str, str]]] = {}
+    for section, key, var in env_map:
+        by_section.setdefault(section, []).append((key, var))
+    
+    lines = ["def _apply_env_map(config, environ, writable):", "    getenv = environ.get"]
+    for section, pairs in by_section.items():
+        lines.append(f"    section = config.get({section!r})")
+        lines.append("    if section is not None:")
+        for key, var in pairs:
+            lines.append(f"        value = getenv({var!r})")
+            lines.append("        if value is not None:")
+            lines.append(f"            section = writable(config, {section!r}, section)")
+            lines.append(f"            section[{key!r}] = value")
+    lines.append("    return None")
+    
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_apply_env_map"]
+
+def _writable_section(config: MutableMapping[str, Any], name: str, section: Mapping[str, Any]) -> MutableMapping[str, Any]:
+    """Return a section that can be written to, replacing a frozen one with a copy."""
+    if isinstance(section, MutableMapping):
+        return section
+    section = config[name] = dict(section)
+    return section
+
+_apply_env_map = _build_env_applier(_ENV_MAP)
+
+# Variables that can trigger _apply_env_map at all
+_OVERRIDE_VARS = frozenset(var for _, _, var in _ENV_MAP)
+
+# Per-instance passwords come from REDIS_PASSWORD_<uid>
+REDIS_PASSWORD_PREFIX = "REDIS_PASSWORD_"
+
+# Where the platform exposes the raw environment, scan it as bytes so only
+# the variables we actually use get decoded
+if os.supports_bytes_environ:
+    _SCAN_ENVIRON = os.environb
+    _SCAN_PREFIX = os.fsencode(REDIS_PASSWORD_PREFIX)
+    _SCAN_OVERRIDE_VARS = frozenset(os.fsencode(var) for var in _OVERRIDE_VARS)
+else:
+    _SCAN_ENVIRON = os.environ
+    _SCAN_PREFIX = REDIS_PASSWORD_PREFIX
+    _SCAN_OVERRIDE_VARS = _OVERRIDE_VARS
+
+def load_config(config_path: str) -> "LazyConfig":
     """
     Load configuration from a JSON file.
     
+    Repeat loads of an unchanged file are served from an in-memory cache
+    without re-reading or re-parsing it.
+    
+    The cached tree is frozen and shared, not copied: every section is a
+    read-only mapping and every list a tuple. Only the top level belongs
+    to the caller; copy a section with dict() before changing it, or take
+    copy.deepcopy() of the result for a fully mutable tree (json.dumps,
+    for one, needs the latter). apply_env_overrides accepts the result
+    as is and copies only the sections it writes to.
+    
+    The whole file is validated once as it is parsed, against the compiled
+    schema when fastjsonschema is installed and with the section
+    validators otherwise, so an invalid file is always rejected here.
+    
     Args:
         config_path: Path to configuration file
         
     Returns:
-        Configuration dictionary
+        LazyConfig with every section already validated
+        
+    Raises:
+        ValueError: If the file cannot be read, parsed or validated
     """
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        st = os.stat(config_path)
+        path = os.path.abspath(config_path)
+        stamp = (st.st_mtime_ns, st.st_size)
         
-        # Apply environment variable overrides
-        apply_env_overrides(config)
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return _wrap_config(cached[1])
         
-        return config
+        return _wrap_config(_parse_config(path))
     except Exception as e:
         raise ValueError(f"Error loading configuration: {e}")
 
-def apply_env_overrides(config: Dict[str, Any]):
+load_config.cache_clear = _CONFIG_CACHE.clear
+
+_SINGLETON: Optional["LazyConfig"] = None
+_SINGLETON_LOCK = threading.Lock()
+
+def get_config(config_path: Optional[str] = None) -> "LazyConfig":
     """
-    Apply environment variable overrides to configuration.
+    Get the process-wide configuration, loading it on first call.
+    
+    Every component shares the same instance, so the file is parsed and
+    validated once per process. The first call always parses the file
+    synchronously, bypassing any cached copy. Use load_config directly
+    for explicit reloads.
     
     Args:
-        config: Configuration dictionary to update
+        config_path: Path to configuration file; defaults to the
+            AGENT_CONFIG environment variable. Ignored once loaded.
+        
+    Returns:
+        Shared LazyConfig
+        
+    Raises:
+        ValueError: If no path is known or the configuration is invalid
+    """
+    global _SINGLETON
+    if _SINGLETON is None:
+        with _SINGLETON_LOCK:
+            if _SINGLETON is None:
+                path = config_path or os.environ.get(CONFIG_PATH_ENV)
+                if not path:
+                    raise ValueError(f"No configuration path given and {CONFIG_PATH_ENV} is not set")
+                
+                # Parse now rather than reuse a cached copy, so the
+                # process-wide config always reflects the file as it is
+                try:
+                    _SINGLETON = _wrap_config(_parse_config(os.path.abspath(path)))
+                except Exception as e:
+                    raise ValueError(f"Error loading configuration: {e}")
+    return _SINGLETON
+
+def _freeze(obj: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(value) for value in obj)
+    return obj
+
+def _thaw(obj: Any) -> Any:
+    """Recursively turn mappings into dicts and tuples into lists."""
+    if isinstance(obj, Mapping):
+        return {key: _thaw(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_thaw(value) for value in obj]
+    return obj
+
+def _wrap_config(config: Mapping[str, Any]) -> "LazyConfig":
+    """Hand out a cached config, sharing its frozen sections."""
+    lazy = LazyConfig(config)
+    # Already checked in full when it was parsed
+    lazy._validated.update(_SECTION_VALIDATORS)
+    return lazy
+
+def _parse_config(path: str) -> Mapping[str, Any]:
     """
-    # Azure OpenAI overrides
-    if "azure_openai" in config:
-        if "AZURE_OPENAI_API_KEY" in os.environ:
-            config["azure_openai"]["api_key"] = os.environ["AZURE_OPENAI_API_KEY"]
+    Parse a configuration file and refresh the in-memory cache.
+    
+    Args:
+        path: Absolute path to configuration file
+        
+    Returns:
+        Frozen configuration with environment overrides applied
         
-        if "AZURE_OPENAI_ENDPOINT" in os.environ:
-            config["azure_openai"]["endpoint"] = os.environ["AZURE_OPENAI_ENDPOINT"]
+    Raises:
+        fastjsonschema.JsonSchemaException: If the compiled schema rejects it
+        ValueError: If the section validators reject it (without fastjsonschema)
+    """
+    with open(path, 'rb') as f:
+        st = os.fstat(f.fileno())
+        if orjson is not None and st.st_size > MMAP_THRESHOLD:
+            config = _mmap_load(f)
+        elif ijson is not None and st.st_size > STREAM_PARSE_THRESHOLD:
+            config = _stream_load(f)
+        else:
+            config = _loads(f.read())
+    stamp = (st.st_mtime_ns, st.st_size)
     
-    # ELK overrides
-    if "elk" in config:
-        if "ELASTICSEARCH_URL" in os.environ:
-            config["elk"]["url"] = os.environ["ELASTICSEARCH_URL"]
+    # Apply environment variable overrides
+    apply_env_overrides(config)
+    
+    # Check structure once per parse, after overrides may have filled in
+    # required fields; only known-good configs reach the cache
+    if _schema_validator is not None:
+        _schema_validator(config)
+    else:
+        errors = _config_errors(config)
+        if errors:
+            raise ValueError("Invalid configuration: " + "; ".join(errors))
+    
+    frozen = _freeze(config)
+    _CONFIG_CACHE[path] = (stamp, frozen)
+    return frozen
+
+def _mmap_load(f) -> Dict[str, Any]:
+    """
+    Parse a configuration file with orjson directly from a memory map.
+    
+    orjson reads the mapped pages in place, avoiding a private bytes copy
+    of the whole file.
+    
+    Args:
+        f: Configuration file opened in binary mode
         
-        if "ELASTICSEARCH_USERNAME" in os.environ:
-            config["elk"]["username"] = os.environ["ELASTICSEARCH_USERNAME"]
+    Returns:
+        Configuration dictionary
+    """
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+def _stream_load(f) -> Dict[str, Any]:
+    """
+    Incrementally parse a large configuration file with ijson.
+    
+    Top-level sections are built one at a time straight from the file,
+    so the raw document is never held in memory alongside the parsed tree.
+    
+    Args:
+        f: Configuration file opened in binary mode
         
-        if "ELASTICSEARCH_PASSWORD" in os.environ:
-            config["elk"]["password"] = os.environ["ELASTICSEARCH_PASSWORD"]
+    Returns:
+        Configuration dictionary
+    """
+    return dict(ijson.kvitems(f, '', use_float=True))
+
+def apply_env_overrides(config: MutableMapping[str, Any]):
+    """
+    Apply environment variable overrides to configuration.
+    
+    Works on plain dicts as well as on the result of load_config: any
+    frozen section (or instance entry) an override writes to is first
+    replaced in config by a mutable copy, leaving the cached tree intact.
+    
+    Args:
+        config: Configuration dictionary to update
+    """
+    # One pass over the environment finds both kinds of override
+    present = False
+    passwords = []
+    prefix_len = len(_SCAN_PREFIX)
+    for var, value in _SCAN_ENVIRON.items():
+        if var.startswith(_SCAN_PREFIX):
+            passwords.append((var[prefix_len:], value))
+        elif var in _SCAN_OVERRIDE_VARS:
+            present = True
+    
+    if present:
+        _apply_env_map(config, os.environ, _writable_section)
+    
+    # Redis password overrides, matched by uid
+    if passwords:
+        # Distinct uids can share a string form (1 and "1"), so keep every match
+        instances = config.get("instances") or ()
+        uid_map = {}
+        for index, instance in enumerate(instances):
+            uid_map.setdefault(str(instance.get("uid", "")), []).append(index)
+        for uid, value in passwords:
+            for index in uid_map.get(os.fsdecode(uid), ()):
+                if not isinstance(instances, MutableSequence):
+                    instances = config["instances"] = list(instances)
+                instance = instances[index]
+                if not isinstance(instance, MutableMapping):
+                    instance = instances[index] = dict(instance)
+                instance["password"] = os.fsdecode(value)
+
+# Fields every instance entry and an enabled Azure OpenAI section must carry
+_INSTANCE_REQUIRED = frozenset(("name", "uid", "endpoints"))
+_AZURE_REQUIRED = frozenset(("api_key", "endpoint", "model"))
+
+def _validate_required(config: Mapping[str, Any]) -> List[str]:
+    """Check that the always-required top-level sections are present."""
+    required_sections = ["instances", "datacenters"]
+    return [
+        f"Missing required configuration section: {section}"
+        for section in required_sections
+        if section not in config
+    ]
+
+def _validate_instances(config: Mapping[str, Any]) -> List[str]:
+    """Validate instance configurations."""
+    instances = config.get("instances", ())
+    if not isinstance(instances, (list, tuple)):
+        return ["Configuration section instances must be a list"]
     
-    # AWS overrides
-    if "dns_config" in config:
-        if "AWS_ACCESS_KEY_ID" in os.environ:
-            config["dns_config"]["aws_access_key"] = os.environ["AWS_ACCESS_KEY_ID"]
+    errors = []
+    for instance in instances:
+        if not isinstance(instance, Mapping):
+            errors.append(f"Instance must be an object: {instance}")
+            continue
         
-        if "AWS_SECRET_ACCESS_KEY" in os.environ:
-            config["dns_config"]["aws_secret_key"] = os.environ["AWS_SECRET_ACCESS_KEY"]
+        missing = _INSTANCE_REQUIRED.difference(instance)
+        if missing:
+            errors.append(f"Instance missing required fields {sorted(missing)}: {instance}")
+            continue
         
-        if "AWS_REGION" in os.environ:
-            config["dns_config"]["aws_region"] = os.environ["AWS_REGION"]
+        endpoints = instance["endpoints"]
+        if not isinstance(endpoints, Mapping) or not endpoints:
+            errors.append(f"Instance has no endpoints: {instance['name']}")
+    return errors
+
+def _validate_datacenters(config: Mapping[str, Any]) -> List[str]:
+    """Validate datacenter configurations."""
+    datacenters = config.get("datacenters", {})
+    if not isinstance(datacenters, Mapping):
+        return ["Configuration section datacenters must be an object"]
+    
+    return [
+        f"Datacenter {dc_name} missing required field: name"
+        for dc_name, dc_config in datacenters.items()
+        if not isinstance(dc_config, Mapping) or "name" not in dc_config
+    ]
+
+def _feature_enabled(config: Mapping[str, Any], flag: str, errors: List[str]) -> bool:
+    """Read a use_* feature flag, which must be a boolean when present."""
+    enabled = config.get(flag, False)
+    if not isinstance(enabled, bool):
+        errors.append(f"{flag} must be true or false")
+        return False
+    return enabled
+
+def _validate_azure(config: Mapping[str, Any]) -> List[str]:
+    """Validate Azure OpenAI configuration if enabled."""
+    errors = []
+    if not _feature_enabled(config, "use_azure_openai", errors):
+        return errors
+    
+    azure_config = config.get("azure_openai")
+    if azure_config is None:
+        return ["Azure OpenAI is enabled but configuration is missing"]
+    if not isinstance(azure_config, Mapping):
+        return ["Azure OpenAI configuration must be an object"]
+    
+    missing = _AZURE_REQUIRED.difference(azure_config)
+    if missing:
+        return [f"Azure OpenAI configuration missing required fields: {', '.join(sorted(missing))}"]
+    return []
+
+def _validate_elk(config: Mapping[str, Any]) -> List[str]:
+    """Validate ELK configuration if enabled."""
+    errors = []
+    if not _feature_enabled(config, "use_elk", errors):
+        return errors
+    
+    elk_config = config.get("elk")
+    if elk_config is None:
+        return ["ELK is enabled but configuration is missing"]
+    if not isinstance(elk_config, Mapping):
+        return ["ELK configuration must be an object"]
     
-    # Redis password overrides
-    for instance in config.get("instances", []):
-        env_var = f"REDIS_PASSWORD_{instance.get('uid', '')}"
-        if env_var in os.environ:
-            instance["password"] = os.environ[env_var]
+    if "url" not in elk_config:
+        return ["ELK configuration missing required field: url"]
+    return []
+
+def _validate_dns(config: Mapping[str, Any]) -> List[str]:
+    """Validate DNS failover configuration if enabled."""
+    if config.get("failover_provider") != "dns":
+        return []
+    
+    dns_config = config.get("dns_config")
+    if dns_config is None:
+        return ["DNS failover provider is enabled but configuration is missing"]
+    if not isinstance(dns_config, Mapping):
+        return ["DNS configuration must be an object"]
     
-    # API key override
-    if "api" in config and "API_KEY" in os.environ:
-        config["api"]["api_key"] = os.environ["API_KEY"]
+    errors = []
+    if config.get("dns_provider") == "route53":
+        if "zone_id" not in dns_config:
+            errors.append("Route53 configuration missing required field: zone_id")
+    
+    records = dns_config.get("records")
+    if not isinstance(records, (list, tuple)) or not records:
+        errors.append("DNS configuration has no records defined")
+    return errors
+
+# Section validators, in the order validate_config runs them
+_SECTION_VALIDATORS = {
+    "instances": _validate_instances,
+    "datacenters": _validate_datacenters,
+    "azure_openai": _validate_azure,
+    "elk": _validate_elk,
+    "dns_config": _validate_dns,
+}
 
-def validate_config(config: Dict[str, Any]) -> bool:
+# Mirrors the section validators above; compiled once into a single function
+_CONFIG_SCHEMA = {
+    "type": "object",
+    "required": ["instances", "datacenters"],
+    "properties": {
+        "instances": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["name", "uid", "endpoints"],
+                "properties": {"endpoints": {"type": "object", "minProperties": 1}},
+            },
+        },
+        "datacenters": {
+            "type": "object",
+            "additionalProperties": {"type": "object", "required": ["name"]},
+        },
+        # Gated on below with const: true, so anything but a boolean is an error
+        "use_azure_openai": {"type": "boolean"},
+        "use_elk": {"type": "boolean"},
+    },
+    "allOf": [
+        {
+            "if": {"required": ["use_azure_openai"], "properties": {"use_azure_openai": {"const": True}}},
+            "then": {
+                "required": ["azure_openai"],
+                "properties": {"azure_openai": {"type": "object", "required": ["api_key", "endpoint", "model"]}},
+            },
+        },
+        {
+            "if": {"required": ["use_elk"], "properties": {"use_elk": {"const": True}}},
+            "then": {"required": ["elk"], "properties": {"elk": {"type": "object", "required": ["url"]}}},
+        },
+        {
+            "if": {"required": ["failover_provider"], "properties": {"failover_provider": {"const": "dns"}}},
+            "then": {
+                "required": ["dns_config"],
+                "properties": {"dns_config": {"type": "object", "required": ["records"], "properties": {"records": {"type": "array", "minItems": 1}}}},
+                "if": {"required": ["dns_provider"], "properties": {"dns_provider": {"const": "route53"}}},
+                "then": {"properties": {"dns_config": {"required": ["zone_id"]}}},
+            },
+        },
+    ],
+}
+
+def _config_errors(config: Mapping[str, Any]) -> List[str]:
+    """Run the required-section check and every section validator."""
+    errors = _validate_required(config)
+    for validator in _SECTION_VALIDATORS.values():
+        errors.extend(validator(config))
+    return errors
+
+_schema_validator = fastjsonschema.compile(_CONFIG_SCHEMA) if fastjsonschema is not None else None
+
+class LazyConfig(dict):
+    """
+    Configuration dictionary that validates each section on first access.
+    
+    Sections belonging to disabled features are never validated unless a
+    component actually reads them. An invalid section raises ValueError
+    when it is first accessed.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._validated = set()
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        if key not in self._validated:
+            validator = _SECTION_VALIDATORS.get(key)
+            # Validate a plain copy so the validator's own reads don't recurse
+            errors = validator(dict(self)) if validator is not None else None
+            if errors:
+                raise ValueError(f"Invalid configuration section {key}: " + "; ".join(errors))
+            self._validated.add(key)
+        return value
+    
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+    
+    def __deepcopy__(self, memo):
+        # Frozen sections can't be deep-copied; hand back a mutable tree
+        lazy = LazyConfig(_thaw(self))
+        lazy._validated.update(self._validated)
+        return lazy
+
+def validate_config(config: Mapping[str, Any]) -> bool:
     """
     Validate configuration structure and required fields.
     
+    Checks the whole tree eagerly, against the compiled schema when
+    fastjsonschema is installed; use LazyConfig to defer the
+    feature-specific sections until they are read. Every problem found
+    is reported in a single log record.
+    
     Args:
         config: Configuration dictionary
         
     Returns:
         True if configuration is valid, False otherwise
     """
-    # Check for required sections
-    required_sections = ["instances", "datacenters"]
-    for section in required_sections:
-        if section not in config:
-            print(f"Missing required configuration section: {section}")
-            return False
-    
-    # Validate instance configurations
-    for instance in config.get("instances", []):
-        if "name" not in instance or "uid" not in instance or "endpoints" not in instance:
-            print(f"Instance missing required fields: {instance}")
-            return False
-        
-        if not instance.get("endpoints"):
-            print(f"Instance has no endpoints: {instance.get('name')}")
-            return False
-    
-    # Validate datacenter configurations
-    for dc_name, dc_config in config.get("datacenters", {}).items():
-        if "name" not in dc_config:
-            print(f"Datacenter {dc_name} missing required field: name")
-            return False
-    
-    # Validate Azure OpenAI configuration if enabled
-    if config.get("use_azure_openai", False):
-        if "azure_openai" not in config:
-            print("Azure OpenAI is enabled but configuration is missing")
-            return False
-        
-        azure_config = config.get("azure_openai", {})
-        required_azure_fields = ["api_key", "endpoint", "model"]
-        for field in required_azure_fields:
-            if field not in azure_config:
-                print(f"Azure OpenAI configuration missing required field: {field}")
-                return False
-    
-    # Validate ELK configuration if enabled
-    if config.get("use_elk", False):
-        if "elk" not in config:
-            print("ELK is enabled but configuration is missing")
-            return False
-        
-        elk_config = config.get("elk", {})
-        if "url" not in elk_config:
-            print("ELK configuration missing required field: url")
-            return False
-    
-    # Validate DNS failover configuration if enabled
-    if config.get("failover_provider") == "dns":
-        if "dns_config" not in config:
-            print("DNS failover provider is enabled but configuration is missing")
-            return False
+    # Plain copy so a LazyConfig's own section checks don't fire mid-walk
+    config = dict(config)
+    schema_error = None
+    if _schema_validator is not None:
+        try:
+            # The schema only recognises dicts and lists, not frozen sections
+            _schema_validator(_thaw(config))
+            return True
+        except fastjsonschema.JsonSchemaException as e:
+            # The schema stops at the first failure; gather the rest below
+            schema_error = e.message
+    
+    errors = _config_errors(config)
+    if not errors and schema_error is not None:
+        errors.append(schema_error)
+    
+    if errors:
+        logger.error("Invalid configuration:\n" + "\n".join(errors))
+    return not errors
+
+class InstanceConfig(NamedTuple):
+    """Typed entry from the ``instances`` section."""
+    name: str
+    uid: str
+    endpoints: Any
+    active_dc: str = "primary"
+    password: Optional[str] = None
+
+class AzureConfig(NamedTuple):
+    """Typed ``azure_openai`` section."""
+    api_key: str
+    endpoint: str
+    model: str = "gpt-4"
+    api_version: str = "2023-05-15"
+    max_tokens: int = 1000
+    temperature: float = 0.2
+    timeout: int = 30
+
+class ElkConfig(NamedTuple):
+    """Typed ``elk`` section."""
+    url: str
+    username: Optional[str] = None
+    password: Optional[str] = None
+    index_pattern: str = "logstash-*"
+    verify_ssl: bool = True
+    timeout: int = 30
+    cache_ttl: int = 300
+    client_logs_only: bool = True
+    errors_only: bool = False
+    headers: Mapping[str, str] = MappingProxyType({})
+
+class DnsConfig(NamedTuple):
+    """Typed ``dns_config`` section."""
+    records: Tuple[Mapping[str, Any], ...] = ()
+    zone_id: Optional[str] = None
+    aws_region: str = "us-east-1"
+    aws_access_key: Optional[str] = None
+    aws_secret_key: Optional[str] = None
+    endpoint_map: Mapping[str, Any] = MappingProxyType({})
+
+class TypedConfig(NamedTuple):
+    """
+    Typed view of a loaded configuration.
+    
+    Sections for disabled features are None. Anything without a typed
+    counterpart stays reachable through ``settings``.
+    """
+    instances: Tuple[InstanceConfig, ...]
+    datacenters: Mapping[str, Mapping[str, Any]]
+    azure_openai: Optional[AzureConfig]
+    elk: Optional[ElkConfig]
+    dns_config: Optional[DnsConfig]
+    settings: "LazyConfig"
+
+def _typed_section(cls, section: Mapping[str, Any]):
+    """Build a typed section from the keys it declares, ignoring the rest."""
+    return cls(**{key: section[key] for key in cls._fields if key in section})
+
+def load_typed_config(config_path: str) -> TypedConfig:
+    """
+    Load configuration and convert it to typed, immutable records.
+    
+    The file is fully validated by load_config, so an invalid
+    configuration raises ValueError here instead of on first use.
+    
+    Args:
+        config_path: Path to configuration file
         
-        dns_config = config.get("dns_config", {})
-        if config.get("dns_provider") == "route53":
-            if "zone_id" not in dns_config:
-                print("Route53 configuration missing required field: zone_id")
-                return False
+    Returns:
+        TypedConfig for the file
         
-        if not dns_config.get("records"):
-            print("DNS configuration has no records defined")
-            return False
+    Raises:
+        ValueError: If the file cannot be loaded or is invalid
+    """
+    config = load_config(config_path)
+    
+    azure = elk = dns = None
+    if config.get("use_azure_openai"):
+        azure = _typed_section(AzureConfig, config["azure_openai"])
+    if config.get("use_elk"):
+        elk = _typed_section(ElkConfig, config["elk"])
+    if config.get("failover_provider") == "dns":
+        dns = _typed_section(DnsConfig, config["dns_config"])
     
-    return True
\ No newline at end of file
+    return TypedConfig(
+        instances=tuple(_typed_section(InstanceConfig, instance) for instance in config["instances"]),
+        datacenters=config["datacenters"],
+        azure_openai=azure,
+        elk=elk,
+        dns_config=dns,
+        settings=config,
+    )